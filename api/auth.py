@@ -1,7 +1,13 @@
 # API authentication module
+import hashlib
+import hmac
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import sys
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Tuple
 import os
 
 from fastapi import Depends, HTTPException, status
@@ -29,7 +35,7 @@ class User(BaseModel):
 
 
 # Get admin credentials from environment variables
-ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "admin")
+ADMIN_USERNAME = sys.intern(os.getenv("ADMIN_USERNAME", "admin"))
 ADMIN_PASSWORD_HASH = os.getenv("ADMIN_PASSWORD_HASH", "")
 
 # If no hash is provided, generate one from default password
@@ -38,16 +44,50 @@ if not ADMIN_PASSWORD_HASH:
     ADMIN_PASSWORD_HASH = pwd_context.hash(default_password)
     logger.warning("Using default admin password. Please set ADMIN_PASSWORD_HASH in .env for production.")
 
+# Read-only admin record, built once from environment variables
+_ADMIN_RECORD: Mapping[str, Any] = MappingProxyType({
+    "username": ADMIN_USERNAME,
+    "hashed_password": ADMIN_PASSWORD_HASH,
+    "disabled": False,
+})
+
 # User database constructed from environment variables
 USERS_DB = {
-    ADMIN_USERNAME: {
-        "username": ADMIN_USERNAME,
-        "hashed_password": ADMIN_PASSWORD_HASH,
-        "disabled": False,
-    }
+    ADMIN_USERNAME: _ADMIN_RECORD
 }
 
 
+# Recent successful password verifications, so repeat logins skip bcrypt.
+# Maps an HMAC of (username, password, hash) to its expiry (monotonic time).
+VERIFY_CACHE_TTL = 60
+VERIFY_CACHE_MAX_SIZE = 1024
+_verify_cache: Dict[str, float] = {}
+
+
+def _verify_cache_key(username: str, password: str, hashed_password: str) -> str:
+    """Derive the verification cache key; the plain password is never stored"""
+    message = "\x00".join((username, password, hashed_password)).encode()
+    return hmac.new(SECURITY_CONFIG["secret_key"].encode(), message, hashlib.sha256).hexdigest()
+
+
+def _remember_verification(cache_key: str) -> None:
+    """Record a successful verification, evicting expired entries when full"""
+    now = time.monotonic()
+    if len(_verify_cache) >= VERIFY_CACHE_MAX_SIZE:
+        for key in [k for k, expires in _verify_cache.items() if expires <= now]:
+            del _verify_cache[key]
+        if len(_verify_cache) >= VERIFY_CACHE_MAX_SIZE:
+            # Still full: drop the oldest entry (dicts keep insertion order)
+            del _verify_cache[next(iter(_verify_cache))]
+    _verify_cache[cache_key] = now + VERIFY_CACHE_TTL
+
+
+# Decoded JWT claims by raw token (LRU), so repeat requests skip jwt.decode.
+# Maps the token to (username, expiry as epoch seconds).
+JWT_CACHE_MAX_SIZE = 10_000
+_jwt_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
     return pwd_context.verify(plain_password, hashed_password)
@@ -58,32 +98,58 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def get_user(username: str) -> Optional[Dict[str, Any]]:
+def get_user(username: str) -> Optional[Mapping[str, Any]]:
     """Get a user from the database"""
+    # Fast path for the admin, which is the only configured user
+    if username == ADMIN_USERNAME:
+        return _ADMIN_RECORD
     if username in USERS_DB:
         user_dict = USERS_DB[username]
         return user_dict
     return None
 
 
-def authenticate_user(username: str, password: str) -> Optional[Dict[str, Any]]:
+def authenticate_user(username: str, password: str) -> Optional[Mapping[str, Any]]:
     """Authenticate a user"""
     user = get_user(username)
     if not user:
         return None
+
+    # bcrypt is deliberately slow, so reuse a recent successful verification
+    cache_key = _verify_cache_key(username, password, user["hashed_password"])
+    expires = _verify_cache.get(cache_key)
+    if expires is not None and expires > time.monotonic():
+        return user
+
     if not verify_password(password, user["hashed_password"]):
         return None
+    _remember_verification(cache_key)
     return user
 
 
-def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
-    """Create a JWT access token"""
+def create_access_token_with_expiry(
+        data: Dict[str, Any],
+        expires_delta: Optional[timedelta] = None
+) -> Tuple[str, int]:
+    """
+    Create a JWT access token and return it with its expiry
+
+    Args:
+        data: Claims to encode
+        expires_delta: Token lifetime, defaults to the configured expiry
+
+    Returns:
+        Tuple of (encoded token, expiry as epoch seconds)
+    """
     to_encode = data.copy()
 
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime = expires_delta.total_seconds()
     else:
-        expire = datetime.utcnow() + timedelta(minutes=SECURITY_CONFIG["access_token_expire_minutes"])
+        lifetime = SECURITY_CONFIG["access_token_expire_minutes"] * 60
+
+    # Epoch seconds are what the exp claim holds, so skip building a datetime
+    expire = int(time.time() + lifetime)
 
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(
@@ -92,7 +158,12 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
         algorithm=SECURITY_CONFIG["algorithm"]
     )
 
-    return encoded_jwt
+    return encoded_jwt, expire
+
+
+def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
+    """Create a JWT access token"""
+    return create_access_token_with_expiry(data, expires_delta)[0]
 
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
@@ -103,17 +174,29 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(
-            token,
-            SECURITY_CONFIG["secret_key"],
-            algorithms=[SECURITY_CONFIG["algorithm"]]
-        )
-        username: str = payload.get("sub")
-        if username is None:
+    cached_claims = _jwt_cache.get(token)
+    if cached_claims is not None and cached_claims[1] > time.time():
+        _jwt_cache.move_to_end(token)
+        username = cached_claims[0]
+    else:
+        _jwt_cache.pop(token, None)
+        try:
+            payload = jwt.decode(
+                token,
+                SECURITY_CONFIG["secret_key"],
+                algorithms=[SECURITY_CONFIG["algorithm"]]
+            )
+            username: str = payload.get("sub")
+            if username is None:
+                raise credentials_exception
+        except JWTError:
             raise credentials_exception
-    except JWTError:
-        raise credentials_exception
+
+        # Only tokens that expire are cached, and only until they expire
+        if payload.get("exp") is not None:
+            _jwt_cache[token] = (username, float(payload["exp"]))
+            if len(_jwt_cache) > JWT_CACHE_MAX_SIZE:
+                _jwt_cache.popitem(last=False)
 
     user = get_user(username)
     if user is None:
@@ -1,135 +1,461 @@
 # API caching module
+import asyncio
 import json
 import hashlib
 import logging
-from typing import Any, Dict, Optional, Callable, Awaitable
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Callable, Awaitable, Tuple
 from functools import wraps
-import redis
 from api.config import CACHE_CONFIG
 
+# Only import the Redis client library when the Redis backend is configured
+if CACHE_CONFIG["type"] == "redis":
+    import redis
+    import redis.asyncio as aioredis
+else:
+    redis = None
+    aioredis = None
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is an optional speedup
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
-# Memory cache dictionary
-_memory_cache: Dict[str, Dict[str, Any]] = {}
+# Clock for in-process cache expiry; a module attribute so tests can replace it
+_clock = time.monotonic
 
 
-class CacheManager:
+class _TTLCache:
+    """Bounded LRU mapping whose entries expire after a per-entry TTL"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live entry, refreshing its LRU position"""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= _clock():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """Store an entry, evicting the least recently used ones when full"""
+        self._data[key] = (_clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        """Remove an entry if present"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+
+
+# In-process memory cache: the memory backend, and a near cache in front of Redis
+_memory_cache = _TTLCache(CACHE_CONFIG["memory_max_entries"])
+
+# Seconds between Redis health checks (PING)
+REDIS_HEALTH_CHECK_INTERVAL = 30
+
+# Shared Redis clients, created on first use
+_redis_client: Optional["redis.Redis"] = None
+_async_redis_client: Optional["aioredis.Redis"] = None
+
+# Result of the last Redis health check and when it was taken (monotonic)
+_redis_available = False
+_redis_checked_at: Optional[float] = None
+
+# Calls currently being computed by cached(), keyed by hashed cache key
+_inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a cache payload to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize a JSON cache payload"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _near_cache_ttl(pttl: int) -> float:
+    """Seconds to keep a Redis value in the near cache, given the key's PTTL in milliseconds"""
+    # Never outlive the Redis entry, and re-read often enough that invalidations
+    # from other workers are seen within near_ttl seconds
+    if pttl < 0:
+        # -1: no expiry set
+        return CACHE_CONFIG["near_ttl"]
+    return min(pttl / 1000, CACHE_CONFIG["near_ttl"])
+
+
+def _hash_bytes(data: bytes) -> str:
+    """Generate a hash for a serialized cache key"""
+    # Keys are never used for security, so prefer the non-cryptographic
+    # xxh128 and fall back to BLAKE2b. Both give a 32-char hex digest.
+    if xxhash is not None:
+        return xxhash.xxh128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _hash_key(key: str) -> str:
+    """Generate a hash for the cache key"""
+    return _hash_bytes(key.encode())
+
+
+def _call_key_bytes(func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> bytes:
+    """Serialize a function call (name and arguments) in one pass for use as a cache key"""
+    key_data = (func.__qualname__, args, sorted(kwargs.items()))
+    if orjson is not None:
+        return orjson.dumps(key_data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(key_data, default=str, sort_keys=True).encode()
+
+
+def _get_redis_client() -> "redis.Redis":
+    """Get the shared Redis client, backed by a connection pool"""
+    global _redis_client
+    if _redis_client is None:
+        pool = redis.ConnectionPool.from_url(CACHE_CONFIG["redis_url"], max_connections=32)
+        _redis_client = redis.Redis(connection_pool=pool)
+    return _redis_client
+
+
+def _is_redis_available() -> bool:
+    """Check if Redis is available, re-checking at most every REDIS_HEALTH_CHECK_INTERVAL seconds"""
+    global _redis_available, _redis_checked_at
+    if CACHE_CONFIG["type"] != "redis":
+        return False
+
+    now = time.monotonic()
+    if _redis_checked_at is not None and now - _redis_checked_at < REDIS_HEALTH_CHECK_INTERVAL:
+        return _redis_available
+
+    try:
+        _get_redis_client().ping()
+        _redis_available = True
+    except (redis.exceptions.ConnectionError, redis.exceptions.ResponseError):
+        logger.warning("Redis connection failed, falling back to memory cache")
+        _redis_available = False
+
+    _redis_checked_at = now
+    return _redis_available
+
+
+def _get_async_redis_client() -> "aioredis.Redis":
+    """Get the shared asyncio Redis client, backed by a connection pool"""
+    global _async_redis_client
+    if _async_redis_client is None:
+        pool = aioredis.ConnectionPool.from_url(CACHE_CONFIG["redis_url"], max_connections=32)
+        _async_redis_client = aioredis.Redis(connection_pool=pool)
+    return _async_redis_client
+
+
+async def _ais_redis_available() -> bool:
+    """Async variant of _is_redis_available that does not block the event loop"""
+    global _redis_available, _redis_checked_at
+    if CACHE_CONFIG["type"] != "redis":
+        return False
+
+    now = time.monotonic()
+    if _redis_checked_at is not None and now - _redis_checked_at < REDIS_HEALTH_CHECK_INTERVAL:
+        return _redis_available
+
+    try:
+        await _get_async_redis_client().ping()
+        _redis_available = True
+    except (redis.exceptions.ConnectionError, redis.exceptions.ResponseError):
+        logger.warning("Redis connection failed, falling back to memory cache")
+        _redis_available = False
+
+    _redis_checked_at = now
+    return _redis_available
+
+
+def get_cache(key: str) -> Optional[Dict[str, Any]]:
     """
-    Cache manager for handling different types of caching mechanisms
+    Get a value from cache
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Cached value or None if not found
+    """
+    return get_cache_by_hash(_hash_key(key))
+
+
+def get_cache_by_hash(hashed_key: str) -> Optional[Dict[str, Any]]:
     """
+    Get a value from cache using an already-hashed key
 
-    @staticmethod
-    def _hash_key(key: str) -> str:
-        """Generate a hash for the cache key"""
-        return hashlib.md5(key.encode()).hexdigest()
+    Args:
+        hashed_key: Hashed cache key (see _hash_key)
+
+    Returns:
+        Cached value or None if not found
+    """
+    if not CACHE_CONFIG["enabled"]:
+        return None
 
-    @staticmethod
-    def _is_redis_available() -> bool:
-        """Check if Redis is available"""
-        if CACHE_CONFIG["type"] != "redis":
-            return False
+    # Serve hot keys from process memory before going to Redis
+    value = _memory_cache.get(hashed_key)
+    if value is not None:
+        return value
 
+    if _is_redis_available():
         try:
-            r = redis.Redis.from_url(CACHE_CONFIG["redis_url"])
-            r.ping()
-            return True
-        except (redis.exceptions.ConnectionError, redis.exceptions.ResponseError):
-            logger.warning("Redis connection failed, falling back to memory cache")
-            return False
-
-    @staticmethod
-    def get_cache(key: str) -> Optional[Dict[str, Any]]:
-        """
-        Get a value from cache
-
-        Args:
-            key: Cache key
-
-        Returns:
-            Cached value or None if not found
-        """
-        if not CACHE_CONFIG["enabled"]:
-            return None
+            r = _get_redis_client()
+            with r.pipeline(transaction=False) as pipe:
+                pipe.get(hashed_key)
+                pipe.pttl(hashed_key)
+                cached_data, pttl = pipe.execute()
+            if cached_data:
+                value = _loads(cached_data)
+                _memory_cache.set(hashed_key, value, _near_cache_ttl(pttl))
+                return value
+        except Exception as e:
+            logger.error(f"Redis cache retrieval error: {str(e)}")
+
+    return None
+
+
+def set_cache(key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+    """
+    Set a value in cache
 
-        hashed_key = CacheManager._hash_key(key)
+    Args:
+        key: Cache key
+        value: Value to cache
+        ttl: Time to live in seconds (None for default TTL)
 
-        if CacheManager._is_redis_available():
-            try:
-                r = redis.Redis.from_url(CACHE_CONFIG["redis_url"])
-                cached_data = r.get(hashed_key)
-                if cached_data:
-                    return json.loads(cached_data)
-            except Exception as e:
-                logger.error(f"Redis cache retrieval error: {str(e)}")
-                # Fall back to memory cache
+    Returns:
+        True if successfully cached, False otherwise
+    """
+    return set_cache_by_hash(_hash_key(key), value, ttl)
 
-        # Use memory cache
-        return _memory_cache.get(hashed_key)
 
-    @staticmethod
-    def set_cache(key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> bool:
-        """
-        Set a value in cache
+def set_cache_by_hash(hashed_key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+    """
+    Set a value in cache using an already-hashed key
 
-        Args:
-            key: Cache key
-            value: Value to cache
-            ttl: Time to live in seconds (None for default TTL)
+    Args:
+        hashed_key: Hashed cache key (see _hash_key)
+        value: Value to cache
+        ttl: Time to live in seconds (None for default TTL)
 
-        Returns:
-            True if successfully cached, False otherwise
-        """
-        if not CACHE_CONFIG["enabled"]:
-            return False
+    Returns:
+        True if successfully cached, False otherwise
+    """
+    if not CACHE_CONFIG["enabled"]:
+        return False
 
-        ttl = ttl or CACHE_CONFIG["ttl"]
-        hashed_key = CacheManager._hash_key(key)
+    ttl = ttl or CACHE_CONFIG["ttl"]
 
-        if CacheManager._is_redis_available():
-            try:
-                r = redis.Redis.from_url(CACHE_CONFIG["redis_url"])
-                r.setex(
-                    hashed_key,
-                    ttl,
-                    json.dumps(value)
-                )
-                return True
-            except Exception as e:
-                logger.error(f"Redis cache setting error: {str(e)}")
-                # Fall back to memory cache
+    if _is_redis_available():
+        try:
+            r = _get_redis_client()
+            r.setex(
+                hashed_key,
+                ttl,
+                _dumps(value)
+            )
+        except Exception as e:
+            logger.error(f"Redis cache setting error: {str(e)}")
 
-        # Use memory cache
-        _memory_cache[hashed_key] = value
-        return True
+        # Near cache in front of Redis, kept short so other workers' invalidations are seen
+        _memory_cache.set(hashed_key, value, min(ttl, CACHE_CONFIG["near_ttl"]))
+    else:
+        # Memory backend
+        _memory_cache.set(hashed_key, value, ttl)
 
-    @staticmethod
-    def invalidate_cache(key: str) -> bool:
-        """
-        Invalidate a cache entry
+    return True
 
-        Args:
-            key: Cache key to invalidate
 
-        Returns:
-            True if successfully invalidated, False otherwise
-        """
-        if not CACHE_CONFIG["enabled"]:
-            return False
+async def aget_cache(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a value from cache without blocking the event loop
 
-        hashed_key = CacheManager._hash_key(key)
+    Args:
+        key: Cache key
 
-        if CacheManager._is_redis_available():
-            try:
-                r = redis.Redis.from_url(CACHE_CONFIG["redis_url"])
-                r.delete(hashed_key)
-            except Exception as e:
-                logger.error(f"Redis cache invalidation error: {str(e)}")
+    Returns:
+        Cached value or None if not found
+    """
+    return await aget_cache_by_hash(_hash_key(key))
+
+
+async def aget_cache_by_hash(hashed_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a value from cache using an already-hashed key without blocking the event loop
+
+    Args:
+        hashed_key: Hashed cache key (see _hash_key)
+
+    Returns:
+        Cached value or None if not found
+    """
+    if not CACHE_CONFIG["enabled"]:
+        return None
+
+    # Serve hot keys from process memory before going to Redis
+    value = _memory_cache.get(hashed_key)
+    if value is not None:
+        return value
+
+    if await _ais_redis_available():
+        try:
+            r = _get_async_redis_client()
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.get(hashed_key)
+                pipe.pttl(hashed_key)
+                cached_data, pttl = await pipe.execute()
+            if cached_data:
+                value = _loads(cached_data)
+                _memory_cache.set(hashed_key, value, _near_cache_ttl(pttl))
+                return value
+        except Exception as e:
+            logger.error(f"Redis cache retrieval error: {str(e)}")
+
+    return None
+
+
+async def aset_cache(key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+    """
+    Set a value in cache without blocking the event loop
+
+    Args:
+        key: Cache key
+        value: Value to cache
+        ttl: Time to live in seconds (None for default TTL)
+
+    Returns:
+        True if successfully cached, False otherwise
+    """
+    return await aset_cache_by_hash(_hash_key(key), value, ttl)
+
+
+async def aset_cache_by_hash(hashed_key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+    """
+    Set a value in cache using an already-hashed key without blocking the event loop
+
+    Args:
+        hashed_key: Hashed cache key (see _hash_key)
+        value: Value to cache
+        ttl: Time to live in seconds (None for default TTL)
+
+    Returns:
+        True if successfully cached, False otherwise
+    """
+    if not CACHE_CONFIG["enabled"]:
+        return False
+
+    ttl = ttl or CACHE_CONFIG["ttl"]
+
+    if await _ais_redis_available():
+        try:
+            r = _get_async_redis_client()
+            await r.setex(
+                hashed_key,
+                ttl,
+                _dumps(value)
+            )
+        except Exception as e:
+            logger.error(f"Redis cache setting error: {str(e)}")
 
-        # Also remove from memory cache
-        if hashed_key in _memory_cache:
-            del _memory_cache[hashed_key]
+        # Near cache in front of Redis, kept short so other workers' invalidations are seen
+        _memory_cache.set(hashed_key, value, min(ttl, CACHE_CONFIG["near_ttl"]))
+    else:
+        # Memory backend
+        _memory_cache.set(hashed_key, value, ttl)
 
-        return True
+    return True
+
+
+def invalidate_cache(key: str) -> bool:
+    """
+    Invalidate a cache entry
+
+    Args:
+        key: Cache key to invalidate
+
+    Returns:
+        True if successfully invalidated, False otherwise
+    """
+    return invalidate_cache_by_hash(_hash_key(key))
+
+
+def invalidate_cache_by_hash(hashed_key: str) -> bool:
+    """
+    Invalidate a cache entry using an already-hashed key
+
+    Args:
+        hashed_key: Hashed cache key to invalidate (see _hash_key)
+
+    Returns:
+        True if successfully invalidated, False otherwise
+    """
+    if not CACHE_CONFIG["enabled"]:
+        return False
+
+    if _is_redis_available():
+        try:
+            r = _get_redis_client()
+            r.delete(hashed_key)
+        except Exception as e:
+            logger.error(f"Redis cache invalidation error: {str(e)}")
+
+    # Also remove from memory cache
+    _memory_cache.pop(hashed_key)
+
+    return True
+
+
+class CacheManager:
+    """
+    Cache manager for handling different types of caching mechanisms
+
+    Namespace over the module-level cache functions, kept for existing callers
+    """
+
+    _hash_key = staticmethod(_hash_key)
+    _get_redis_client = staticmethod(_get_redis_client)
+    _is_redis_available = staticmethod(_is_redis_available)
+    _get_async_redis_client = staticmethod(_get_async_redis_client)
+    _ais_redis_available = staticmethod(_ais_redis_available)
+    get_cache = staticmethod(get_cache)
+    get_cache_by_hash = staticmethod(get_cache_by_hash)
+    set_cache = staticmethod(set_cache)
+    set_cache_by_hash = staticmethod(set_cache_by_hash)
+    aget_cache = staticmethod(aget_cache)
+    aget_cache_by_hash = staticmethod(aget_cache_by_hash)
+    aset_cache = staticmethod(aset_cache)
+    aset_cache_by_hash = staticmethod(aset_cache_by_hash)
+    invalidate_cache = staticmethod(invalidate_cache)
+    invalidate_cache_by_hash = staticmethod(invalidate_cache_by_hash)
 
 
 def cached(ttl: Optional[int] = None):
@@ -146,34 +472,59 @@ def cached(ttl: Optional[int] = None):
             if not CACHE_CONFIG["enabled"]:
                 return await func(*args, **kwargs)
 
-            # Generate a cache key from function name and arguments
-            key_parts = [func.__name__]
-            for arg in args:
-                if isinstance(arg, dict):
-                    key_parts.append(json.dumps(arg, sort_keys=True))
-                else:
-                    key_parts.append(str(arg))
-
-            for k, v in sorted(kwargs.items()):
-                if isinstance(v, dict):
-                    key_parts.append(f"{k}:{json.dumps(v, sort_keys=True)}")
-                else:
-                    key_parts.append(f"{k}:{v}")
-
-            cache_key = ":".join(key_parts)
-
-            # Try to get from cache
-            cached_result = CacheManager.get_cache(cache_key)
-            if cached_result:
-                logger.info(f"Cache hit for '{cache_key}'")
-                return cached_result
+            # Generate a cache key from function name and arguments, hashed once
+            # and reused for both the lookup and the store
+            try:
+                hashed_key = _hash_bytes(_call_key_bytes(func, args, kwargs))
+            except (TypeError, ValueError) as e:
+                # Arguments that cannot be serialized into a key just skip the cache
+                logger.warning(f"Not caching call to '{func.__qualname__}': {str(e)}")
+                return await func(*args, **kwargs)
+            cache_key = f"{func.__qualname__}:{hashed_key}"
+
+            while True:
+                # Try to get from cache
+                cached_result = await aget_cache_by_hash(hashed_key)
+                if cached_result:
+                    logger.info(f"Cache hit for '{cache_key}'")
+                    return cached_result
+
+                # Coalesce with an identical call that is already running
+                inflight = _inflight.get(hashed_key)
+                if inflight is None:
+                    break
+
+                logger.info(f"Waiting on in-flight call for '{cache_key}'")
+                # Wait without linking this caller's cancellation to the shared call
+                await asyncio.wait((inflight,))
+                if not inflight.cancelled():
+                    return inflight.result()
+
+                # The leading call was cancelled, not this one: look again and
+                # take over as leader if no other caller has
+                logger.info(f"In-flight call for '{cache_key}' was cancelled, retrying")
 
             # Execute function if not cached
             logger.info(f"Cache miss for '{cache_key}'")
-            result = await func(*args, **kwargs)
+            future = asyncio.get_running_loop().create_future()
+            _inflight[hashed_key] = future
+            try:
+                result = await func(*args, **kwargs)
 
-            # Cache the result
-            CacheManager.set_cache(cache_key, result, ttl)
+                # Cache the result
+                await aset_cache_by_hash(hashed_key, result, ttl)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                # Mark the exception as retrieved in case nobody was waiting
+                future.exception()
+                raise
+            else:
+                future.set_result(result)
+            finally:
+                _inflight.pop(hashed_key, None)
 
             return result
 
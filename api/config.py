@@ -44,7 +44,9 @@ CACHE_CONFIG: Dict[str, Any] = {
     "enabled": os.getenv("CACHE_ENABLED", "true").lower() == "true",
     "type": os.getenv("CACHE_TYPE", "memory"),  # "memory" or "redis"
     "redis_url": os.getenv("REDIS_URL", "redis://localhost:6379/0"),
-    "ttl": int(os.getenv("CACHE_TTL", "3600"))  # Default cache TTL in seconds (1 hour)
+    "ttl": int(os.getenv("CACHE_TTL", "3600")),  # Default cache TTL in seconds (1 hour)
+    "memory_max_entries": int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", "1024")),  # In-process LRU size
+    "near_ttl": int(os.getenv("CACHE_NEAR_TTL", "30"))  # Max seconds Redis values stay in process memory
 }
 
 # Logging Configuration
@@ -1,14 +1,17 @@
 # API routes module
+import asyncio
 import logging
+import os
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import BinaryIO, Iterator, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
 from api.auth import (
     authenticate_user,
-    create_access_token,
+    create_access_token_with_expiry,
     get_current_active_user,
     User
 )
@@ -16,13 +19,31 @@ from api.config import SECURITY_CONFIG
 from models.request import ResearchRequest
 from models.response import ResearchResponse, TokenResponse, StatusResponse, ErrorResponse
 from core.researcher import Researcher
-from core.storage import get_research_result, list_research_results, delete_research_result
+from core.storage import get_research_result_path, list_research_results, delete_research_result
 
 logger = logging.getLogger(__name__)
 
 # Create router
 router = APIRouter()
 
+# Read size when streaming stored research reports
+_FILE_CHUNK_SIZE = 64 * 1024
+
+
+def _open_result(file_path: "os.PathLike[str]") -> Optional[BinaryIO]:
+    """Open a stored research report, or return None if it no longer exists"""
+    try:
+        return open(file_path, "rb")
+    except FileNotFoundError:
+        return None
+
+
+def _iter_file(result_file: BinaryIO) -> Iterator[bytes]:
+    """Yield an open file's contents in chunks, closing it when done"""
+    with result_file:
+        while chunk := result_file.read(_FILE_CHUNK_SIZE):
+            yield chunk
+
 
 @router.post("/token", response_model=TokenResponse)
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
@@ -39,18 +60,15 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
 
     # Create access token
     access_token_expires = timedelta(minutes=SECURITY_CONFIG["access_token_expire_minutes"])
-    access_token = create_access_token(
+    access_token, expires_at = create_access_token_with_expiry(
         data={"sub": user["username"]},
         expires_delta=access_token_expires
     )
 
-    # Calculate expiration time
-    expires_at = datetime.utcnow() + access_token_expires
-
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "expires_at": expires_at
+        "expires_at": datetime.utcfromtimestamp(expires_at)
     }
 
 
@@ -85,7 +103,14 @@ async def conduct_research(
         )
 
 
-@router.get("/research/{report_id}", response_model=ResearchResponse)
+@router.get(
+    "/research/{report_id}",
+    # The stored file is returned as-is, so the model documents the body without validating it
+    responses={
+        200: {"model": ResearchResponse, "description": "The stored research report"},
+        404: {"model": ErrorResponse, "description": "Research report not found"},
+    },
+)
 async def get_research(
         report_id: str = Path(..., description="ID of the research report"),
         current_user: User = Depends(get_current_active_user)
@@ -93,14 +118,23 @@ async def get_research(
     """
     Get a research report by ID
     """
-    result = await get_research_result(report_id)
-    if not result:
+    file_path = await get_research_result_path(report_id)
+    # Open before responding: an open file can be streamed even if it is deleted
+    # meanwhile, and a delete between the lookup and the open is still a 404
+    result_file = await asyncio.to_thread(_open_result, file_path) if file_path else None
+    if result_file is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Research report with ID {report_id} not found"
         )
 
-    return result
+    # The stored file is already the serialized ResearchResponse, so stream it
+    # as-is instead of loading it and re-encoding it through the response model
+    return StreamingResponse(
+        _iter_file(result_file),
+        media_type="application/json",
+        headers={"Content-Length": str(os.fstat(result_file.fileno()).st_size)}
+    )
 
 
 @router.get("/research", response_model=List[ResearchResponse])
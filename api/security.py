@@ -1,42 +1,80 @@
 # API security module
-import re
 import logging
+import os
+import threading
 from typing import Dict, Any, List, Optional
-from fastapi import FastAPI, Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI, HTTPException, status
 from starlette.middleware.httpsredirect import HTTPSRedirectMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from api.config import SECURITY_CONFIG
+# Input scanning lives in core so models can share it; re-exported for existing callers
+from core.input_scan import INJECTION_PATTERNS, check_for_injection, sanitize_input, scan_input  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
+# Security headers added to every response, encoded once at import
+_SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"content-security-policy", b"default-src 'self'"),
+)
 
-class SecurityMiddleware(BaseHTTPMiddleware):
-    """Middleware for security checks and input validation"""
+# Random bytes for request IDs, refilled from os.urandom a page at a time
+_REQUEST_ID_BYTES = 8
+_request_id_buffer = bytearray()
+_request_id_lock = threading.Lock()
 
-    async def dispatch(self, request: Request, call_next):
-        # Get request path and method
-        path = request.url.path
-        method = request.method
+
+def _generate_request_id() -> str:
+    """Return a random 16-character hex request ID"""
+    global _request_id_buffer
+    with _request_id_lock:
+        if len(_request_id_buffer) < _REQUEST_ID_BYTES:
+            # One getrandom() call serves the next 512 request IDs
+            _request_id_buffer = bytearray(os.urandom(4096))
+        request_id = _request_id_buffer[:_REQUEST_ID_BYTES].hex()
+        del _request_id_buffer[:_REQUEST_ID_BYTES]
+    return request_id
+
+
+class SecurityMiddleware:
+    """Pure ASGI middleware for security checks and security response headers"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Skip security checks for certain paths (e.g., docs, static files)
+        path = scope["path"]
         if path.startswith("/docs") or path.startswith("/redoc") or path.startswith("/static"):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Additional request validation can be added here
         # For example, check for suspicious patterns in headers, query params, etc.
 
-        # Continue processing the request
-        response = await call_next(request)
+        # Request ID, readable downstream as request.state.request_id
+        request_id = _generate_request_id()
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        # Add security headers to response
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
+        async def send_with_security_headers(message: Message):
+            if message["type"] == "http.response.start":
+                # Add security headers to response in a single list extension
+                headers = list(message.get("headers", ()))
+                headers.extend(_SECURITY_HEADERS)
+                headers.append((b"x-request-id", request_id.encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
 
-        return response
+        # Continue processing the request
+        await self.app(scope, receive, send_with_security_headers)
 
 
 def setup_security_middleware(app: FastAPI):
@@ -49,49 +87,6 @@ def setup_security_middleware(app: FastAPI):
     app.add_middleware(SecurityMiddleware)
 
 
-def sanitize_input(input_str: str) -> str:
-    """
-    Sanitize user input to prevent injection attacks
-
-    Args:
-        input_str: Input string to sanitize
-
-    Returns:
-        Sanitized string
-    """
-    # Basic sanitization - remove suspicious patterns
-    sanitized = re.sub(r'[;\'"\\]', '', input_str)
-
-    return sanitized
-
-
-def check_for_injection(input_str: str) -> bool:
-    """
-    Check if input contains potential injection patterns
-
-    Args:
-        input_str: Input string to check
-
-    Returns:
-        True if injection patterns are found, False otherwise
-    """
-    # List of potential prompt injection patterns
-    injection_patterns = [
-        r'ignore previous instructions',
-        r'disregard',
-        r'ignore all',
-        r'system prompt',
-        r'user prompt'
-    ]
-
-    # Check for patterns
-    for pattern in injection_patterns:
-        if re.search(pattern, input_str.lower()):
-            return True
-
-    return False
-
-
 def validate_and_sanitize_input(input_str: str) -> str:
     """
     Validate and sanitize user input
@@ -105,15 +100,13 @@ def validate_and_sanitize_input(input_str: str) -> str:
     Raises:
         HTTPException: If input contains potential injection patterns
     """
-    # Check for injection patterns
-    if check_for_injection(input_str):
+    # Check for injection patterns and sanitize the input in one pass
+    sanitized, injection_found = scan_input(input_str)
+    if injection_found:
         logger.warning(f"Potential prompt injection detected: {input_str}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid input detected"
         )
 
-    # Sanitize the input
-    sanitized = sanitize_input(input_str)
-
-    return sanitized
\ No newline at end of file
+    return sanitized
@@ -4,11 +4,38 @@ import hashlib
 import json
 import os
 import uuid
-from typing import Dict, Any, Optional, List, Union
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Optional, Union
 from datetime import datetime
+from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Translation table replacing characters that are invalid in filenames with underscores
+_FILENAME_TRANSLATION = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Strings longer than this are hashed directly instead of being kept in the LRU cache
+_HASH_CACHE_MAX_INPUT = 64 * 1024
+
+
+def generate_hash_bytes(data: bytes) -> str:
+    """
+    Generate a hash for data that is already encoded
+
+    Args:
+        data: Bytes to hash
+
+    Returns:
+        Hash string
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _generate_hash_cached(data: str) -> str:
+    """Memoized SHA-256 of a (small) string"""
+    return generate_hash_bytes(data.encode())
+
 
 def generate_hash(data: str) -> str:
     """
@@ -20,21 +47,27 @@ def generate_hash(data: str) -> str:
     Returns:
         Hash string
     """
-    return hashlib.sha256(data.encode()).hexdigest()
+    # Repeated small inputs are served from the cache; large ones are not kept
+    if len(data) > _HASH_CACHE_MAX_INPUT:
+        return generate_hash_bytes(data.encode())
+    return _generate_hash_cached(data)
 
 
-def filter_dict(data: Dict[str, Any], keys: List[str]) -> Dict[str, Any]:
+def filter_dict(data: Dict[str, Any], keys: Iterable[str]) -> Dict[str, Any]:
     """
     Filter a dictionary to include only specified keys
 
     Args:
         data: Dictionary to filter
-        keys: List of keys to include
+        keys: Keys to include
 
     Returns:
         Filtered dictionary
     """
-    return {k: v for k, v in data.items() if k in keys}
+    # Hash the keys once so membership checks are O(1) instead of a list scan;
+    # walking data keeps its key order in the result
+    key_set = keys if isinstance(keys, (set, frozenset)) else frozenset(keys)
+    return {k: v for k, v in data.items() if k in key_set}
 
 
 def format_duration(seconds: float) -> str:
@@ -116,13 +149,18 @@ def deep_merge_dicts(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str,
     """
     result = dict1.copy()
 
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            # If both values are dictionaries, merge them recursively
-            result[key] = deep_merge_dicts(result[key], value)
-        else:
-            # Otherwise, just overwrite the value
-            result[key] = value
+    # Explicit stack of (target, source) pairs instead of recursion
+    stack = [(result, dict2)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
+                # If both values are dictionaries, merge into a copy so dict1 is untouched
+                target[key] = target[key].copy()
+                stack.append((target[key], value))
+            else:
+                # Otherwise, just overwrite the value
+                target[key] = value
 
     return result
 
@@ -137,18 +175,20 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Replace invalid characters with underscores
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Replace invalid characters with underscores in a single pass
+    filename = filename.translate(_FILENAME_TRANSLATION)
 
-    # Limit length to avoid issues with filesystem limits
+    # Limit length to avoid issues with filesystem limits, which count bytes.
+    # A UTF-8 character is at most 4 bytes, so short names skip the encode.
     max_length = 255
-    if len(filename) > max_length:
-        name, ext = os.path.splitext(filename)
-        filename = f"{name[:max_length - len(ext) - 1]}{ext}"
+    if len(filename) <= max_length // 4 or len(filename.encode('utf-8')) <= max_length:
+        return filename
 
-    return filename
+    name, ext = os.path.splitext(filename)
+    ext_bytes = ext.encode('utf-8')
+    name_bytes = name.encode('utf-8')[:max_length - len(ext_bytes) - 1]
+    # Drop any multibyte character split by the cut
+    return f"{name_bytes.decode('utf-8', errors='ignore')}{ext}"
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -175,7 +215,7 @@ def flatten_dict(d: Dict[str, Any], parent_key: str = "", sep: str = "_") -> Dic
 
     Args:
         d: Dictionary to flatten
-        parent_key: Parent key for recursion
+        parent_key: Prefix for the flattened keys
         sep: Separator for keys
 
     Returns:
@@ -183,17 +223,25 @@ def flatten_dict(d: Dict[str, Any], parent_key: str = "", sep: str = "_") -> Dic
     """
     items = []
 
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep).items())
-        else:
+    # Depth-first walk with an explicit stack of (key prefix, items iterator)
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, iterator = stack[-1]
+        for k, v in iterator:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+
+            if isinstance(v, dict):
+                # Descend now; the rest of this level resumes afterwards
+                stack.append((new_key, iter(v.items())))
+                break
             items.append((new_key, v))
+        else:
+            stack.pop()
 
     return dict(items)
 
 
+@lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     """
     Extract domain from URL
@@ -205,16 +253,10 @@ def extract_domain(url: str) -> str:
         Domain string
     """
     try:
-        from urllib.parse import urlparse
-
         parsed_url = urlparse(url)
-        domain = parsed_url.netloc
 
         # Remove www. prefix if present
-        if domain.startswith('www.'):
-            domain = domain[4:]
-
-        return domain
+        return parsed_url.netloc.removeprefix('www.')
     except Exception as e:
         logger.error(f"Error extracting domain from URL {url}: {str(e)}")
         return url
\ No newline at end of file
@@ -0,0 +1,144 @@
+# Input scanning module: prompt injection detection and sanitization
+import re
+import threading
+from functools import lru_cache
+from typing import Tuple
+
+try:
+    import hyperscan
+except ImportError:  # hyperscan is an optional speedup
+    hyperscan = None
+
+# Potential prompt injection patterns
+INJECTION_PATTERNS = (
+    r'ignore previous instructions',
+    r'disregard',
+    r'ignore all',
+    r'system prompt',
+    r'user prompt'
+)
+
+# Characters stripped from user input
+_SANITIZE_RE = re.compile(r'[;\'"\\]')
+
+# Injection patterns as matched against raw input. Stripped characters may sit
+# between the letters of a pattern, so "dis;regard" is rejected just as
+# "disregard" is, rather than slipping through and being joined up by sanitizing.
+_STRIPPED_RUN = f"{_SANITIZE_RE.pattern}*"
+_INJECTION_SCAN_PATTERNS = tuple(
+    _STRIPPED_RUN.join(map(re.escape, pattern)) for pattern in INJECTION_PATTERNS
+)
+
+# Compiled once: all injection patterns as a single case-insensitive alternation.
+# ASCII-only case folding matches Hyperscan's caseless mode, so "ſ" is not "s"
+# and results do not depend on whether hyperscan is installed.
+_INJECTION_RE = re.compile("|".join(_INJECTION_SCAN_PATTERNS), re.IGNORECASE | re.ASCII)
+
+# Injection patterns and stripped characters in one regex, so validation and
+# sanitization share a single pass over the input
+_VALIDATE_AND_SANITIZE_RE = re.compile(
+    "(?P<injection>{})|(?P<strip>{})".format(_INJECTION_RE.pattern, _SANITIZE_RE.pattern),
+    re.IGNORECASE | re.ASCII
+)
+
+
+class _InjectionDetected(Exception):
+    """Raised from the combined substitution to stop at the first injection match"""
+
+
+def _strip_or_reject(match: "re.Match[str]") -> str:
+    """Substitution callback: drop stripped characters, abort on an injection pattern"""
+    if match.lastgroup == "injection":
+        raise _InjectionDetected
+    return ''
+
+
+def _build_injection_database():
+    """Compile the injection patterns into a Hyperscan multi-pattern database"""
+    expressions = [pattern.encode() for pattern in _INJECTION_SCAN_PATTERNS]
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(expressions)
+    )
+    return database
+
+
+# Hyperscan database for the injection scan (None when hyperscan is unavailable)
+_INJECTION_DB = _build_injection_database() if hyperscan is not None else None
+
+# Hyperscan scratch space is not thread-safe, so keep one per thread
+_scratch_local = threading.local()
+
+
+def _stop_on_match(*_args) -> bool:
+    """Hyperscan match handler: returning True stops the scan at the first hit"""
+    return True
+
+
+@lru_cache(maxsize=1024)
+def sanitize_input(input_str: str) -> str:
+    """
+    Sanitize user input to prevent injection attacks
+
+    Args:
+        input_str: Input string to sanitize
+
+    Returns:
+        Sanitized string
+    """
+    # Basic sanitization - remove suspicious patterns
+    sanitized = _SANITIZE_RE.sub('', input_str)
+
+    return sanitized
+
+
+@lru_cache(maxsize=1024)
+def check_for_injection(input_str: str) -> bool:
+    """
+    Check if input contains potential injection patterns
+
+    Args:
+        input_str: Input string to check
+
+    Returns:
+        True if injection patterns are found, False otherwise
+    """
+    if _INJECTION_DB is not None:
+        # Linear-time multi-pattern scan that stops at the first match
+        scratch = getattr(_scratch_local, "scratch", None)
+        if scratch is None:
+            scratch = _scratch_local.scratch = hyperscan.Scratch(_INJECTION_DB)
+        try:
+            _INJECTION_DB.scan(input_str.encode(), match_event_handler=_stop_on_match, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
+    # One pass over the input for all patterns, without a lowercased copy
+    return _INJECTION_RE.search(input_str) is not None
+
+
+@lru_cache(maxsize=1024)
+def scan_input(input_str: str) -> Tuple[str, bool]:
+    """
+    Sanitize input and check it for injection patterns in a single pass
+
+    Args:
+        input_str: Input string to scan
+
+    Returns:
+        Tuple of (sanitized string, whether an injection pattern was found)
+    """
+    if _INJECTION_DB is not None:
+        # Hyperscan finds injections in one linear scan; only clean input is sanitized
+        if check_for_injection(input_str):
+            return input_str, True
+        return sanitize_input(input_str), False
+
+    try:
+        return _VALIDATE_AND_SANITIZE_RE.sub(_strip_or_reject, input_str), False
+    except _InjectionDetected:
+        return input_str, True
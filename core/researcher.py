@@ -1,21 +1,35 @@
 import logging
-import uuid
+import hashlib
 import asyncio
 from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime
 
-import nest_asyncio
-from gpt_researcher import GPTResearcher
 from api.config import RESEARCHER_CONFIG
 from api.security import validate_and_sanitize_input
 from api.cache import cached
-from core.storage import save_research_result
-
-# Apply nest_asyncio for running in environments that already have an event loop
-nest_asyncio.apply()
+from core.storage import get_research_result, save_research_result
 
 logger = logging.getLogger(__name__)
 
+# gpt_researcher pulls in LLM SDKs and HTTP clients and takes most of a second
+# to import, so it is loaded on the first research call instead of at startup
+GPTResearcher = None
+
+
+def _get_gpt_researcher_class():
+    """Import GPTResearcher on first use"""
+    global GPTResearcher
+    if GPTResearcher is None:
+        from gpt_researcher import GPTResearcher as gpt_researcher_class
+        GPTResearcher = gpt_researcher_class
+    return GPTResearcher
+
+
+def _report_id(query: str, report_type: str, tone: str) -> str:
+    """Derive a stable report ID from the (sanitized) research inputs"""
+    key = f"{report_type}|{tone}|{query}".encode()
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
 
 class Researcher:
     """Main researcher class for conducting AI-powered research"""
@@ -46,7 +60,7 @@ class Researcher:
 
             # Create the researcher instance with three arguments: query, report_type, and tone
             # This assumes GPTResearcher accepts these three positional arguments
-            researcher = GPTResearcher(query, report_type, tone)
+            researcher = _get_gpt_researcher_class()(query, report_type, tone)
 
             # Conduct research
             research_result = await researcher.conduct_research()
@@ -87,8 +101,13 @@ class Researcher:
         # Validate and sanitize input
         sanitized_query = validate_and_sanitize_input(query)
 
-        # Generate a unique ID for this research
-        report_id = str(uuid.uuid4())
+        # The report ID is derived from the inputs, so identical research
+        # requests map to the same stored report, even across restarts
+        report_id = _report_id(sanitized_query, report_type, tone)
+        stored_result = await get_research_result(report_id)
+        if stored_result is not None:
+            logger.info(f"Returning stored research {report_id} for query: {sanitized_query}")
+            return stored_result
 
         # Conduct research
         logger.info(f"Starting research for query: {sanitized_query} with tone: {tone}")
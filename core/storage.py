@@ -1,16 +1,100 @@
 # Storage management module
 import os
+import re
 import json
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import heapq
+import threading
+import time
+from typing import Dict, Any, List, Optional, Set
 from pathlib import Path
 
 from api.config import RESULTS_DIR
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Result filenames written by save_research_result: {timestamp}_{report_id}.json
+_RESULT_FILENAME_RE = re.compile(r'^\d{8}_\d{6}_(?P<report_id>.+)\.json$')
+
+# report_id -> file path for the results directory, filled incrementally so
+# lookups only parse files this process has not seen before
+_result_index: Dict[str, Path] = {}
+_indexed_files: Set[Path] = set()
+# Lookups run in worker threads, so index reads and updates are serialized.
+# Held only for dict/set operations, never for file system calls.
+_index_lock = threading.Lock()
+
+
+def _index_file(report_id: str, file_path: Path) -> None:
+    """Record where a report is stored"""
+    with _index_lock:
+        _result_index[report_id] = file_path
+        _indexed_files.add(file_path)
+
+
+def _unindex_file(report_id: str, file_path: Path) -> None:
+    """Forget a report that is no longer on disk"""
+    with _index_lock:
+        if _result_index.get(report_id) == file_path:
+            del _result_index[report_id]
+        _indexed_files.discard(file_path)
+
+
+def _sync_index() -> None:
+    """Index result files written since the last sync (e.g. by another worker)"""
+    # List and parse new files without holding the lock, so a save on the
+    # event loop never waits for a directory scan; only the merge is locked
+    new_files = []
+    for file_path in RESULTS_DIR.glob("*.json"):
+        # A stale answer here only means a file is parsed twice
+        if file_path in _indexed_files:
+            continue
+
+        # The report_id is part of the filename; only parse files named otherwise
+        match = _RESULT_FILENAME_RE.match(file_path.name)
+        if match:
+            report_id = match.group("report_id")
+        else:
+            try:
+                report_id = _read_json(file_path).get("report_id")
+            except Exception as e:
+                logger.error(f"Error reading file {file_path}: {str(e)}")
+                continue
+
+        new_files.append((report_id, file_path))
+
+    with _index_lock:
+        for report_id, file_path in new_files:
+            _indexed_files.add(file_path)
+            if report_id is not None:
+                _result_index.setdefault(report_id, file_path)
+
+
+def _write_json(file_path: Path, data: Dict[str, Any]) -> None:
+    """Write data to a JSON file (blocking, run it in a worker thread)"""
+    # Serialize up front and write once; json.dump issues a write per chunk
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    with open(file_path, 'wb') as f:
+        f.write(payload)
+
+
+def _read_json(file_path: Path) -> Any:
+    """Read and parse a JSON file"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 async def save_research_result(result: Dict[str, Any]) -> str:
     """
@@ -23,26 +107,112 @@ async def save_research_result(result: Dict[str, Any]) -> str:
         Path to the saved file
     """
     # Create results directory if it doesn't exist
-    if not RESULTS_DIR.exists():
-        RESULTS_DIR.mkdir(parents=True)
+    os.makedirs(RESULTS_DIR, exist_ok=True)
 
     # Generate filename based on report_id and timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Fixed-width fields formatted directly, skipping strftime's locale handling
+    t = time.localtime()
+    timestamp = f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
     report_id = result.get("report_id", "unknown")
     filename = f"{timestamp}_{report_id}.json"
 
     # Create full path
     file_path = RESULTS_DIR / filename
 
-    # Save to file as JSON
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    # Save to file as JSON without blocking the event loop
+    await asyncio.to_thread(_write_json, file_path, result)
+    _index_file(report_id, file_path)
 
     logger.info(f"Saved research result to {file_path}")
 
     return str(file_path)
 
 
+def _find_result(report_id: str) -> Optional[Path]:
+    """Find the stored file for a report_id"""
+    # Check if results directory exists
+    if not RESULTS_DIR.exists():
+        return None
+
+    with _index_lock:
+        file_path = _result_index.get(report_id)
+    if file_path is not None:
+        if file_path.exists():
+            return file_path
+        # Removed behind our back, e.g. by another worker
+        _unindex_file(report_id, file_path)
+
+    # Not indexed yet: pick up any new files, then look again
+    _sync_index()
+    with _index_lock:
+        return _result_index.get(report_id)
+
+
+def _load_result(report_id: str) -> Optional[Dict[str, Any]]:
+    """Find and read a stored result (blocking, run it in a worker thread)"""
+    file_path = _find_result(report_id)
+    if file_path is None:
+        return None
+
+    try:
+        return _read_json(file_path)
+    except Exception as e:
+        logger.error(f"Error reading file {file_path}: {str(e)}")
+        return None
+
+
+def _list_results(limit: int, offset: int) -> List[Dict[str, Any]]:
+    """Read a page of stored results, newest first (blocking, run it in a worker thread)"""
+    # Check if results directory exists
+    if not RESULTS_DIR.exists():
+        return []
+
+    # One directory listing, then one stat per JSON file (DirEntry.stat() is
+    # still a syscall on Linux; only the listing itself is shared)
+    entries = []
+    with os.scandir(RESULTS_DIR) as it:
+        for entry in it:
+            if entry.name.endswith(".json"):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    # Removed since the directory was listed
+                    continue
+
+    # Only the newest offset + limit files are needed, so skip the full sort
+    newest = heapq.nlargest(offset + limit, entries, key=lambda item: item[0])
+
+    # Apply pagination
+    paginated_files = [file_path for _, file_path in newest[offset:]]
+
+    # Load research results
+    results = []
+    for file_path in paginated_files:
+        try:
+            results.append(_read_json(file_path))
+        except Exception as e:
+            logger.error(f"Error reading file {file_path}: {str(e)}")
+
+    return results
+
+
+def _delete_result(report_id: str) -> bool:
+    """Find and delete a stored result (blocking, run it in a worker thread)"""
+    file_path = _find_result(report_id)
+    if file_path is None:
+        return False
+
+    try:
+        # Delete the file
+        file_path.unlink()
+        _unindex_file(report_id, file_path)
+        logger.info(f"Deleted research result {report_id}")
+        return True
+    except Exception as e:
+        logger.error(f"Error processing file {file_path}: {str(e)}")
+        return False
+
+
 async def get_research_result(report_id: str) -> Optional[Dict[str, Any]]:
     """
     Get a research result by ID
@@ -53,22 +223,20 @@ async def get_research_result(report_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Research result dictionary or None if not found
     """
-    # Check if results directory exists
-    if not RESULTS_DIR.exists():
-        return None
+    return await asyncio.to_thread(_load_result, report_id)
 
-    # Find file with matching report_id
-    for file_path in RESULTS_DIR.glob("*.json"):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if data.get("report_id") == report_id:
-                    return data
-        except Exception as e:
-            logger.error(f"Error reading file {file_path}: {str(e)}")
 
-    # Not found
-    return None
+async def get_research_result_path(report_id: str) -> Optional[Path]:
+    """
+    Get the path of the stored file for a research result
+
+    Args:
+        report_id: ID of the research report
+
+    Returns:
+        Path to the JSON file or None if not found
+    """
+    return await asyncio.to_thread(_find_result, report_id)
 
 
 async def list_research_results(limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
@@ -82,27 +250,7 @@ async def list_research_results(limit: int = 10, offset: int = 0) -> List[Dict[s
     Returns:
         List of research results
     """
-    # Check if results directory exists
-    if not RESULTS_DIR.exists():
-        return []
-
-    # Get all JSON files in the results directory
-    files = sorted(RESULTS_DIR.glob("*.json"), key=os.path.getmtime, reverse=True)
-
-    # Apply pagination
-    paginated_files = files[offset:offset + limit]
-
-    # Load research results
-    results = []
-    for file_path in paginated_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                results.append(data)
-        except Exception as e:
-            logger.error(f"Error reading file {file_path}: {str(e)}")
-
-    return results
+    return await asyncio.to_thread(_list_results, limit, offset)
 
 
 async def delete_research_result(report_id: str) -> bool:
@@ -115,22 +263,4 @@ async def delete_research_result(report_id: str) -> bool:
     Returns:
         True if deleted successfully, False otherwise
     """
-    # Check if results directory exists
-    if not RESULTS_DIR.exists():
-        return False
-
-    # Find file with matching report_id
-    for file_path in RESULTS_DIR.glob("*.json"):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if data.get("report_id") == report_id:
-                    # Delete the file
-                    file_path.unlink()
-                    logger.info(f"Deleted research result {report_id}")
-                    return True
-        except Exception as e:
-            logger.error(f"Error processing file {file_path}: {str(e)}")
-
-    # Not found
-    return False
\ No newline at end of file
+    return await asyncio.to_thread(_delete_result, report_id)
@@ -1,27 +1,83 @@
 # Main application entry point
+import atexit
+import json
 import logging
+import logging.handlers
+import os
+import queue
 import uvicorn
-import nest_asyncio
 import ssl
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from api.config import API_CONFIG, LOGGING_CONFIG
 from api.routes import router as api_router
 from api.security import setup_security_middleware
 
-# Enable nested asyncio for Jupyter-like environments
-nest_asyncio.apply()
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, LOGGING_CONFIG["level"]),
-    format=LOGGING_CONFIG["format"]
-)
+try:
+    import uvloop
+except ImportError:  # uvloop is an optional speedup
+    uvloop = None
+
+# Nested event loops are only needed in Jupyter-like environments, and
+# nest_asyncio patches every loop it runs on, so it is opt-in via NEST_ASYNCIO=1.
+# It cannot patch uvloop's loop, so enabling it also selects the stock loop.
+NEST_ASYNCIO = os.getenv("NEST_ASYNCIO") == "1"
+if NEST_ASYNCIO:
+    import nest_asyncio
+    nest_asyncio.apply()
+
+
+# Configure logging. Records are queued and written by a background listener
+# thread, so logging from request handlers never blocks the event loop on I/O.
+def configure_logging() -> None:
+    """Route root logging through a queue, once per process"""
+    root_logger = logging.getLogger()
+    # This module can run twice in one process (uvicorn reload imports it as
+    # __mp_main__ and again as main), which would otherwise log every line twice
+    if any(isinstance(handler, logging.handlers.QueueHandler) for handler in root_logger.handlers):
+        return
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(logging.Formatter(LOGGING_CONFIG["format"]))
+    log_listener = logging.handlers.QueueListener(log_queue, log_handler, respect_handler_level=True)
+    root_logger.setLevel(getattr(logging, LOGGING_CONFIG["level"]))
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Health check payload, encoded once at startup
+HEALTH_BODY = json.dumps({"status": "healthy", "version": API_CONFIG["version"]}, separators=(",", ":")).encode()
+HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(HEALTH_BODY)).encode()),
+]
+
+
+class HealthCheckMiddleware:
+    """Outermost ASGI middleware that answers GET /health without the rest of the stack"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and scope["path"] == "/health" and scope["method"] == "GET":
+            await send({"type": "http.response.start", "status": 200, "headers": HEALTH_HEADERS})
+            await send({"type": "http.response.body", "body": HEALTH_BODY})
+            return
+
+        await self.app(scope, receive, send)
+
+
 # Create FastAPI application
 app = FastAPI(
     title=API_CONFIG["title"],
@@ -43,6 +99,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses such as full research reports
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Added last so it wraps everything else; load balancer probes skip the middleware chain
+app.add_middleware(HealthCheckMiddleware)
+
 # Include API router
 app.include_router(api_router)
 
@@ -66,7 +128,7 @@ async def root():
     }
 
 
-# Health check endpoint
+# Health check endpoint (served by HealthCheckMiddleware; kept for the OpenAPI schema)
 @app.get("/health")
 async def health_check():
     return {
@@ -93,5 +155,6 @@ if __name__ == "__main__":
         port=8383,  # Standard HTTPS port is 443, but 8443 is common for development
         ssl_certfile="./certs/server.crt",
         ssl_keyfile="./certs/server.key",
+        loop="uvloop" if uvloop is not None and not NEST_ASYNCIO else "asyncio",
         reload=True
     )
\ No newline at end of file
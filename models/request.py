@@ -1,8 +1,40 @@
 # Request data models
-from pydantic import BaseModel, Field, validator
-import re
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 
+from core.input_scan import scan_input
+
+# Report types supported by GPT-Researcher
+SUPPORTED_REPORT_TYPES = (
+    "research_report",  # Summary - Short and fast
+    "detailed_report",  # Detailed - In depth and longer
+    "resource_report",
+    "outline_report",
+    "custom_report",
+    "subtopic_report"
+)
+_SUPPORTED_REPORT_TYPES_SET = frozenset(SUPPORTED_REPORT_TYPES)
+
+# Report tones supported by GPT-Researcher
+SUPPORTED_TONES = (
+    "objective",  # Impartial and unbiased presentation
+    "formal",  # Academic standards with sophisticated language
+    "analytical",  # Critical evaluation and examination
+    "persuasive",  # Convincing viewpoint
+    "informative",  # Clear and comprehensive information
+    "explanatory",  # Clarifying complex concepts
+    "descriptive",  # Detailed depiction
+    "critical",  # Judging validity and relevance
+    "comparative",  # Juxtaposing different theories
+    "speculative",  # Exploring hypotheses
+    "reflective",  # Personal insights
+    "narrative",  # Story-based presentation
+    "humorous",  # Light-hearted and engaging
+    "optimistic",  # Highlighting positive aspects
+    "pessimistic"  # Focusing on challenges
+)
+_SUPPORTED_TONES_SET = frozenset(SUPPORTED_TONES)
+
 
 class ResearchRequest(BaseModel):
     """Model for research request data"""
@@ -10,62 +42,29 @@ class ResearchRequest(BaseModel):
     report_type: str = Field("research_report", description="Type of report to generate")
     tone: Optional[str] = Field("objective", description="Tone of the research report")
 
-    @validator('query')
-    def validate_query(cls, v):
-        # Remove any potential malicious input or injection attempts
-        # Basic sanitization - remove suspicious patterns
-        sanitized = re.sub(r'[;\'"\\]', '', v)
-
-        # Check for potential prompt injection attempts
-        injection_patterns = [
-            r'ignore previous instructions',
-            r'disregard',
-            r'ignore all',
-            r'system prompt',
-            r'user prompt'
-        ]
-
-        for pattern in injection_patterns:
-            if re.search(pattern, sanitized.lower()):
-                raise ValueError(f"Query contains potential prompt injection pattern")
+    @field_validator('query')
+    @classmethod
+    def validate_query(cls, v: str) -> str:
+        # Remove suspicious characters and check for prompt injection attempts
+        # in one pass, shared with api.security.validate_and_sanitize_input via core.input_scan
+        sanitized, injection_found = scan_input(v)
+        if injection_found:
+            raise ValueError(f"Query contains potential prompt injection pattern")
 
         return sanitized
 
-    @validator('report_type')
-    def validate_report_type(cls, v):
-        valid_types = [
-            "research_report",  # Summary - Short and fast
-            "detailed_report",  # Detailed - In depth and longer
-            "resource_report",
-            "outline_report",
-            "custom_report",
-            "subtopic_report"
-        ]
-        if v not in valid_types:
-            raise ValueError(f"Report type must be one of: {', '.join(valid_types)}")
+    @field_validator('report_type')
+    @classmethod
+    def validate_report_type(cls, v: str) -> str:
+        if v not in _SUPPORTED_REPORT_TYPES_SET:
+            raise ValueError(f"Report type must be one of: {', '.join(SUPPORTED_REPORT_TYPES)}")
         return v
 
-    @validator('tone')
-    def validate_tone(cls, v):
-        valid_tones = [
-            "objective",  # Impartial and unbiased presentation
-            "formal",  # Academic standards with sophisticated language
-            "analytical",  # Critical evaluation and examination
-            "persuasive",  # Convincing viewpoint
-            "informative",  # Clear and comprehensive information
-            "explanatory",  # Clarifying complex concepts
-            "descriptive",  # Detailed depiction
-            "critical",  # Judging validity and relevance
-            "comparative",  # Juxtaposing different theories
-            "speculative",  # Exploring hypotheses
-            "reflective",  # Personal insights
-            "narrative",  # Story-based presentation
-            "humorous",  # Light-hearted and engaging
-            "optimistic",  # Highlighting positive aspects
-            "pessimistic"  # Focusing on challenges
-        ]
-        if v not in valid_tones:
-            raise ValueError(f"Tone must be one of: {', '.join(valid_tones)}")
+    @field_validator('tone')
+    @classmethod
+    def validate_tone(cls, v: Optional[str]) -> Optional[str]:
+        if v not in _SUPPORTED_TONES_SET:
+            raise ValueError(f"Tone must be one of: {', '.join(SUPPORTED_TONES)}")
         return v
 
 
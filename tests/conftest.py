@@ -1,24 +1,32 @@
 # Test configuration
 import pytest
 import os
-from unittest.mock import patch
 from fastapi.testclient import TestClient
 from main import app
+from api.auth import User, get_current_user
+from core import storage
 
 # This is to make tests bypass authentication
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="session")
 def mock_auth_dependency():
-    """Bypass authentication for tests by mocking the dependency"""
-    with patch('api.routes.get_current_user') as mock_auth:
-        # Return a mock user
-        mock_auth.return_value = {"username": "testuser", "disabled": False}
-        yield mock_auth
+    """Bypass authentication for tests by overriding the dependency once per session"""
+    app.dependency_overrides[get_current_user] = lambda: User(username="testuser", disabled=False)
+    yield
+    app.dependency_overrides.pop(get_current_user, None)
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_storage_index():
+    """Forget indexed result files, since tests point RESULTS_DIR at their own directories"""
+    storage._result_index.clear()
+    storage._indexed_files.clear()
+    yield
+
+
+@pytest.fixture(scope="session")
 def client():
     """
-    Create a test client for the FastAPI application
+    Create a test client for the FastAPI application, shared by the whole session
     """
     with TestClient(app) as client:
         yield client
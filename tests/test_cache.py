@@ -0,0 +1,160 @@
+# Cache tests
+import asyncio
+
+import pytest
+
+from api import cache
+from api.cache import CacheManager, cached
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    """Enable the in-memory cache with a fake clock and start from an empty cache"""
+    monkeypatch.setitem(cache.CACHE_CONFIG, "enabled", True)
+    monkeypatch.setattr(cache, "_is_redis_available", lambda: False)
+
+    # Drive TTL expiry from a fake monotonic clock instead of sleeping
+    now = [1000.0]
+    monkeypatch.setattr(cache, "_clock", lambda: now[0])
+
+    cache._memory_cache.clear()
+    yield now
+    cache._memory_cache.clear()
+
+
+def test_cache_set_and_get(memory_cache):
+    """Test storing and retrieving a cached value"""
+    assert CacheManager.set_cache("test-key", {"value": 1}, ttl=2)
+    assert CacheManager.get_cache("test-key") == {"value": 1}
+    assert CacheManager.get_cache("missing-key") is None
+
+
+def test_cache_expiration(memory_cache):
+    """Test that cached values expire after their TTL"""
+    CacheManager.set_cache("test-key", {"value": 1}, ttl=2)
+
+    # Still live just before the TTL runs out
+    memory_cache[0] += 1.9
+    assert CacheManager.get_cache("test-key") == {"value": 1}
+
+    # Expired once the TTL has passed
+    memory_cache[0] += 0.2
+    assert CacheManager.get_cache("test-key") is None
+
+
+def test_cache_invalidation(memory_cache):
+    """Test invalidating a cached value"""
+    CacheManager.set_cache("test-key", {"value": 1}, ttl=2)
+
+    assert CacheManager.invalidate_cache("test-key")
+    assert CacheManager.get_cache("test-key") is None
+
+
+class _FakeRedis:
+    """Redis client stub whose pipeline answers GET and PTTL for a single key"""
+
+    def __init__(self, payload, pttl):
+        self.payload = payload
+        self.pttl_ms = pttl
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def get(self, key):
+        pass
+
+    def pttl(self, key):
+        pass
+
+    def execute(self):
+        return [self.payload, self.pttl_ms]
+
+
+@pytest.mark.parametrize("pttl,near_ttl,expires_after", [
+    (1500, 30, 1.5),  # Redis expiry comes first
+    (600000, 30, 30),  # near-cache cap comes first
+    (-1, 30, 30),  # no Redis expiry
+])
+def test_redis_value_near_cache_ttl(memory_cache, monkeypatch, pttl, near_ttl, expires_after):
+    """Test that values read from Redis stay in process memory no longer than allowed"""
+    monkeypatch.setitem(cache.CACHE_CONFIG, "near_ttl", near_ttl)
+    monkeypatch.setattr(cache, "_is_redis_available", lambda: True)
+    monkeypatch.setattr(cache, "_get_redis_client", lambda: _FakeRedis(b'{"value": 1}', pttl))
+
+    assert CacheManager.get_cache("test-key") == {"value": 1}
+
+    # Served from the near cache until it expires, then read from Redis again
+    monkeypatch.setattr(cache, "_get_redis_client", lambda: _FakeRedis(None, -2))
+    memory_cache[0] += expires_after - 0.1
+    assert CacheManager.get_cache("test-key") == {"value": 1}
+    memory_cache[0] += 0.2
+    assert CacheManager.get_cache("test-key") is None
+
+
+async def test_cached_non_str_dict_keys(memory_cache):
+    """Test that dict arguments with non-str keys are cached like any other"""
+    calls = []
+
+    @cached()
+    async def compute(mapping):
+        calls.append(mapping)
+        return {"total": sum(mapping.values())}
+
+    assert await compute({1: 2, 3: 4}) == {"total": 6}
+    assert await compute({1: 2, 3: 4}) == {"total": 6}
+    assert len(calls) == 1
+
+
+async def test_cached_unserializable_arguments_run_uncached(memory_cache):
+    """Test that arguments which cannot form a cache key skip the cache instead of failing"""
+    calls = []
+    circular = []
+    circular.append(circular)
+
+    @cached()
+    async def compute(value):
+        calls.append(value)
+        return {"value": 1}
+
+    assert await compute(circular) == {"value": 1}
+    assert await compute(circular) == {"value": 1}
+    assert len(calls) == 2
+
+
+async def test_cached_waiter_survives_leader_cancellation(memory_cache):
+    """Test that cancelling the leading call does not cancel callers waiting on it"""
+    calls = []
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    @cached()
+    async def compute(value):
+        calls.append(value)
+        started.set()
+        await release.wait()
+        return {"value": value}
+
+    leader = asyncio.create_task(compute(1))
+    await started.wait()
+    started.clear()
+
+    # The second caller waits on the leader's in-flight call
+    waiter = asyncio.create_task(compute(1))
+    await asyncio.sleep(0)
+    assert len(calls) == 1
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    # The waiter takes over and runs the call itself
+    await started.wait()
+    release.set()
+    assert await waiter == {"value": 1}
+    assert len(calls) == 2
@@ -1,17 +1,15 @@
 # Core functionality tests
-import pytest
-import os
-import json
 from pathlib import Path
 from unittest.mock import patch, AsyncMock, MagicMock
 
+import orjson
+
 from core.researcher import Researcher
 from core.storage import save_research_result, get_research_result, list_research_results, delete_research_result
-from api.config import RESULTS_DIR
+from api.config import RESEARCHER_CONFIG
 
 
-@pytest.mark.asyncio
-async def test_researcher_conduct_research():
+async def test_researcher_conduct_research(monkeypatch):
     """Test the research conducting functionality"""
     # Create mock GPTResearcher class and methods
     mock_gpt_researcher = MagicMock()
@@ -22,12 +20,14 @@ async def test_researcher_conduct_research():
     mock_gpt_researcher.get_research_images = MagicMock(return_value=["image1.jpg"])
     mock_gpt_researcher.get_research_sources = MagicMock(return_value=[{"url": "example.com"}])
 
-    # Patch the GPTResearcher class
-    with patch("core.researcher.GPTResearcher", return_value=mock_gpt_researcher), \
-            patch("core.storage.save_research_result", new_callable=AsyncMock) as mock_save:
-        # Set environment variables for testing
-        os.environ["OPENAI_API_KEY"] = "test-key"
+    # Set environment variables for testing; RESEARCHER_CONFIG is read at import, so patch it too
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setitem(RESEARCHER_CONFIG, "openai_api_key", "test-key")
 
+    # Patch the GPTResearcher class and the storage functions the researcher imported
+    with patch("core.researcher.GPTResearcher", return_value=mock_gpt_researcher), \
+            patch("core.researcher.get_research_result", new_callable=AsyncMock, return_value=None), \
+            patch("core.researcher.save_research_result", new_callable=AsyncMock) as mock_save:
         # Call the conduct_research method
         result = await Researcher.conduct_research("Test query", "research_report")
 
@@ -44,17 +44,12 @@ async def test_researcher_conduct_research():
         # Verify that save_research_result was called
         mock_save.assert_called_once()
 
-        # Clean up
-        os.environ.pop("OPENAI_API_KEY", None)
 
-
-@pytest.mark.asyncio
-async def test_save_research_result(tmp_path):
+async def test_save_research_result(fs):
     """Test saving research results to file"""
-    # Set up a temporary results directory
-    original_results_dir = RESULTS_DIR
-    test_results_dir = tmp_path / "results"
-    test_results_dir.mkdir()
+    # Set up a results directory on the in-memory filesystem
+    test_results_dir = Path("/results")
+    fs.create_dir(test_results_dir)
 
     # Patch the RESULTS_DIR
     with patch("core.storage.RESULTS_DIR", test_results_dir):
@@ -77,17 +72,15 @@ async def test_save_research_result(tmp_path):
         assert Path(file_path).exists()
 
         # Verify the file contents
-        with open(file_path, 'r', encoding='utf-8') as f:
-            saved_data = json.load(f)
-            assert saved_data == test_data
+        saved_data = orjson.loads(Path(file_path).read_bytes())
+        assert saved_data == test_data
 
 
-@pytest.mark.asyncio
-async def test_get_research_result(tmp_path):
+async def test_get_research_result(fs):
     """Test retrieving research results from file"""
-    # Set up a temporary results directory
-    test_results_dir = tmp_path / "results"
-    test_results_dir.mkdir()
+    # Set up a results directory on the in-memory filesystem
+    test_results_dir = Path("/results")
+    fs.create_dir(test_results_dir)
 
     # Patch the RESULTS_DIR
     with patch("core.storage.RESULTS_DIR", test_results_dir):
@@ -105,8 +98,7 @@ async def test_get_research_result(tmp_path):
 
         # Save the research result to a file
         file_path = test_results_dir / "test_file.json"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(test_data, f)
+        file_path.write_bytes(orjson.dumps(test_data))
 
         # Retrieve the research result
         result = await get_research_result("test-report-id")
@@ -119,12 +111,11 @@ async def test_get_research_result(tmp_path):
         assert result is None
 
 
-@pytest.mark.asyncio
-async def test_list_research_results(tmp_path):
+async def test_list_research_results(fs):
     """Test listing research results"""
-    # Set up a temporary results directory
-    test_results_dir = tmp_path / "results"
-    test_results_dir.mkdir()
+    # Set up a results directory on the in-memory filesystem
+    test_results_dir = Path("/results")
+    fs.create_dir(test_results_dir)
 
     # Patch the RESULTS_DIR
     with patch("core.storage.RESULTS_DIR", test_results_dir):
@@ -138,15 +129,13 @@ async def test_list_research_results(tmp_path):
             "report_id": "test-report-id-2"
         }
 
-        # Save the test files
-        file_path_1 = test_results_dir / "test_file_1.json"
-        file_path_2 = test_results_dir / "test_file_2.json"
-
-        with open(file_path_1, 'w', encoding='utf-8') as f:
-            json.dump(test_data_1, f)
-
-        with open(file_path_2, 'w', encoding='utf-8') as f:
-            json.dump(test_data_2, f)
+        # Save the test files, serializing the payloads up front
+        payloads = [
+            (test_results_dir / "test_file_1.json", orjson.dumps(test_data_1)),
+            (test_results_dir / "test_file_2.json", orjson.dumps(test_data_2)),
+        ]
+        for file_path, payload in payloads:
+            file_path.write_bytes(payload)
 
         # List the research results
         results = await list_research_results()
@@ -164,12 +153,11 @@ async def test_list_research_results(tmp_path):
         assert len(results) == 1
 
 
-@pytest.mark.asyncio
-async def test_delete_research_result(tmp_path):
+async def test_delete_research_result(fs):
     """Test deleting research results"""
-    # Set up a temporary results directory
-    test_results_dir = tmp_path / "results"
-    test_results_dir.mkdir()
+    # Set up a results directory on the in-memory filesystem
+    test_results_dir = Path("/results")
+    fs.create_dir(test_results_dir)
 
     # Patch the RESULTS_DIR
     with patch("core.storage.RESULTS_DIR", test_results_dir):
@@ -187,8 +175,7 @@ async def test_delete_research_result(tmp_path):
 
         # Save the research result to a file
         file_path = test_results_dir / "test_file.json"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(test_data, f)
+        file_path.write_bytes(orjson.dumps(test_data))
 
         # Delete the research result
         result = await delete_research_result("test-report-id")
@@ -0,0 +1,20 @@
+# Utility function tests
+import pytest
+
+from api.utils import filter_dict
+
+
+@pytest.mark.parametrize("data,keys,expected", [
+    # Fewer keys than data
+    ({"a": 1, "b": 2, "c": 3}, ["c", "a"], {"a": 1, "c": 3}),
+    ({"a": 1, "b": 2, "c": 3}, {"c", "a"}, {"a": 1, "c": 3}),
+    # At least as many keys as data
+    ({"a": 1, "b": 2}, ["b", "a"], {"a": 1, "b": 2}),
+    ({"a": 1, "b": 2}, iter(["b", "z", "a"]), {"a": 1, "b": 2}),
+])
+def test_filter_dict_keeps_data_order(data, keys, expected):
+    """Test that filtered keys come back in the order they appear in data"""
+    result = filter_dict(data, keys)
+
+    assert result == expected
+    assert list(result) == list(expected)